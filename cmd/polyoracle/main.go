@@ -10,6 +10,7 @@ import (
 	"syscall"
 	"time"
 
+	"github.com/google/uuid"
 	"github.com/rewired-gh/polyoracle/internal/config"
 	"github.com/rewired-gh/polyoracle/internal/logger"
 	"github.com/rewired-gh/polyoracle/internal/models"
@@ -24,6 +25,10 @@ var configPath = flag.String("config", "configs/config.yaml", "Path to configura
 func main() {
 	flag.Parse()
 
+	// Change IDs are UUIDs generated once per detected change. Pooling amortizes
+	// the crypto/rand read to one syscall per pool refill instead of one per ID.
+	uuid.EnableRandPool()
+
 	// Load configuration
 	cfg, err := config.Load(*configPath)
 	if err != nil {
@@ -101,7 +106,13 @@ func main() {
 		telegramClient.ListenForCommands(ctx)
 	}
 
-	// Start monitoring loop
+	// Start monitoring loop.
+	// Window = (N+1) × pollInterval, not N × pollInterval.
+	// With cycleTime-stamped snapshots, the oldest snapshot from N cycles ago is
+	// exactly N×pollInterval old at tick time, but GetSnapshotsInWindow runs after
+	// processing completes (tick + τ), making it N×pollInterval + τ old. The extra
+	// interval absorbs τ so the boundary snapshot is never accidentally excluded.
+	// Computed once here and shared by every cycle.
 	effectiveWindow := time.Duration(cfg.Monitor.DetectionIntervals+1) * cfg.Polymarket.PollInterval
 	logger.Info("Starting monitoring service (interval: %v, detection_intervals: %d, effective_window: %v, sensitivity: %.2f, top_k: %d)",
 		cfg.Polymarket.PollInterval,
@@ -142,7 +153,7 @@ func main() {
 
 	// Run initial poll immediately
 	logger.Debug("Running initial monitoring cycle")
-	handleCycleResult(runMonitoringCycle(ctx, polyClient, mon, store, telegramClient, cfg, time.Now()))
+	handleCycleResult(runMonitoringCycle(ctx, polyClient, mon, store, telegramClient, cfg, time.Now(), effectiveWindow))
 
 	for {
 		select {
@@ -152,7 +163,7 @@ func main() {
 
 		case tickTime := <-ticker.C:
 			logger.Debug("Starting scheduled monitoring cycle")
-			handleCycleResult(runMonitoringCycle(ctx, polyClient, mon, store, telegramClient, cfg, tickTime))
+			handleCycleResult(runMonitoringCycle(ctx, polyClient, mon, store, telegramClient, cfg, tickTime, effectiveWindow))
 
 			// Rotate old data
 			if err := store.RotateSnapshots(); err != nil {
@@ -173,6 +184,7 @@ func runMonitoringCycle(
 	telegramClient *telegram.Client,
 	cfg *config.Config,
 	cycleTime time.Time, // tick time (or startup time for the initial cycle)
+	detectionWindow time.Duration, // (detection_intervals+1) × poll_interval, computed once in main
 ) error {
 	startTime := time.Now()
 	logger.Info("Starting monitoring cycle")
@@ -195,63 +207,50 @@ func runMonitoringCycle(
 
 	// Update storage with new events and create snapshots
 	logger.Debug("Processing fetched events and creating snapshots")
-	newEvents := 0
-	updatedEvents := 0
+	processedEvents := 0
+	snapshots := make([]*models.Snapshot, 0, len(events))
 	for i := range events {
 		event := &events[i]
 
-		// Add or update event
-		existingEvent, err := store.GetMarket(event.ID)
-		if err != nil {
-			// Event doesn't exist, create it
-			if err := store.AddMarket(event); err != nil {
-				logger.Warn("Failed to add event %s: %v", event.ID, err)
-				continue
-			}
-			newEvents++
-		} else {
-			// Update existing event
-			event.CreatedAt = existingEvent.CreatedAt
-			if err := store.UpdateMarket(event); err != nil {
-				logger.Warn("Failed to update event %s: %v", event.ID, err)
-				continue
-			}
-			updatedEvents++
+		// Add or update event in one statement; existing rows keep their created_at
+		if err := store.UpsertMarket(event); err != nil {
+			logger.Warn("Failed to upsert event %s: %v", event.ID, err)
+			continue
 		}
+		processedEvents++
 
 		// Create snapshot for current probability.
 		// Use cycleTime (tick time) as the timestamp, not time.Now() after processing.
 		// This ensures snapshot ages are exact multiples of pollInterval, so the
 		// detection window math is not skewed by per-cycle processing latency.
-		snapshot := &models.Snapshot{
-			ID:             generateID(),
+		snapshots = append(snapshots, &models.Snapshot{
+			ID:             uuid.NewString(),
 			EventID:        event.ID,
 			YesProbability: event.YesProbability,
 			NoProbability:  event.NoProbability,
 			Timestamp:      cycleTime,
 			Source:         "polymarket-gamma-api",
-		}
+		})
+	}
 
-		if err := store.AddSnapshot(snapshot); err != nil {
-			logger.Warn("Failed to add snapshot for event %s: %v", event.ID, err)
-		}
+	// Insert the whole cycle's snapshots in one transaction
+	snapshotErrors, err := store.AddSnapshots(snapshots)
+	if err != nil {
+		logger.Warn("Failed to add snapshots: %v", err)
+	}
+	for _, snapErr := range snapshotErrors {
+		logger.Warn("Failed to add snapshot: %v", snapErr)
 	}
-	logger.Debug("Event processing complete: %d new, %d updated", newEvents, updatedEvents)
+	logger.Debug("Event processing complete: %d events upserted", processedEvents)
 
 	// Detect significant changes
 	allEvents, err := store.GetAllMarkets()
 	if err != nil {
 		return fmt.Errorf("failed to get events: %w", err)
 	}
-	// Window = (N+1) × pollInterval, not N × pollInterval.
-	// With cycleTime-stamped snapshots, the oldest snapshot from N cycles ago is
-	// exactly N×pollInterval old at tick time, but GetSnapshotsInWindow runs after
-	// processing completes (tick + τ), making it N×pollInterval + τ old. The extra
-	// interval absorbs τ so the boundary snapshot is never accidentally excluded.
-	detectionWindow := time.Duration(cfg.Monitor.DetectionIntervals+1) * cfg.Polymarket.PollInterval
 	logger.Debug("Detecting changes across %d total events (window: %v = (%d+1) × %v)",
 		len(allEvents), detectionWindow, cfg.Monitor.DetectionIntervals, cfg.Polymarket.PollInterval)
-	changes, detectionErrors, err := mon.DetectChanges(convertMarkets(allEvents), detectionWindow)
+	changes, detectionErrors, err := mon.DetectChanges(allEvents, detectionWindow)
 	if err != nil {
 		return fmt.Errorf("failed to detect changes: %w", err)
 	}
@@ -311,18 +310,6 @@ func runMonitoringCycle(
 	return nil
 }
 
-func generateID() string {
-	return fmt.Sprintf("%d", time.Now().UnixNano())
-}
-
-func convertMarkets(markets []*models.Market) []models.Market {
-	result := make([]models.Market, len(markets))
-	for i, market := range markets {
-		result[i] = *market
-	}
-	return result
-}
-
 func buildMarketsMap(markets []*models.Market) map[string]*models.Market {
 	result := make(map[string]*models.Market, len(markets))
 	for _, market := range markets {
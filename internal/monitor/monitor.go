@@ -15,8 +15,11 @@
 package monitor
 
 import (
+	"cmp"
+	"container/heap"
 	"fmt"
 	"math"
+	"slices"
 	"sort"
 	"time"
 
@@ -66,12 +69,20 @@ const probEpsilon = 1e-7
 
 // DetectChanges identifies probability changes within a time window that exceed the
 // minimum floor (0.1%). Scoring via ScoreAndRank is responsible for quality filtering.
-// Returns changes, per-event errors (non-fatal), and a fatal error if window is invalid.
-func (m *Monitor) DetectChanges(markets []models.Market, window time.Duration) ([]models.Change, []DetectionError, error) {
+// Snapshots for all markets are loaded in a single batched query rather than one
+// query per market, so the per-market loop runs entirely in memory.
+// Returns changes, per-event errors (non-fatal), and a fatal error if window is
+// invalid or the batched snapshot read fails.
+func (m *Monitor) DetectChanges(markets []*models.Market, window time.Duration) ([]models.Change, []DetectionError, error) {
 	if window <= 0 {
 		return nil, nil, fmt.Errorf("invalid window %v: must be positive", window)
 	}
 
+	snapshotsByMarket, err := m.storage.GetSnapshotsInWindowAll(window)
+	if err != nil {
+		return nil, nil, fmt.Errorf("failed to load snapshots in window: %w", err)
+	}
+
 	var changes []models.Change
 	var detectionErrors []DetectionError
 	now := time.Now()
@@ -83,11 +94,7 @@ func (m *Monitor) DetectChanges(markets []models.Market, window time.Duration) (
 	maxChangeSeen := 0.0
 
 	for _, market := range markets {
-		snapshots, err := m.storage.GetSnapshotsInWindow(market.ID, window)
-		if err != nil {
-			detectionErrors = append(detectionErrors, DetectionError{EventID: market.ID, Err: err})
-			continue
-		}
+		snapshots := snapshotsByMarket[market.ID]
 
 		if len(snapshots) == 0 {
 			eventsWithZeroSnapshots++
@@ -103,7 +110,9 @@ func (m *Monitor) DetectChanges(markets []models.Market, window time.Duration) (
 		oldest := snapshots[0]
 		current := snapshots[len(snapshots)-1]
 
-		change := math.Abs(current.YesProbability - oldest.YesProbability)
+		// One signed delta serves both the magnitude and the direction.
+		delta := current.YesProbability - oldest.YesProbability
+		change := math.Abs(delta)
 
 		if change > maxChangeSeen {
 			maxChangeSeen = change
@@ -111,7 +120,7 @@ func (m *Monitor) DetectChanges(markets []models.Market, window time.Duration) (
 
 		if change >= minProbabilityChange {
 			direction := "increase"
-			if current.YesProbability < oldest.YesProbability {
+			if delta < 0 {
 				direction = "decrease"
 			}
 
@@ -147,8 +156,8 @@ func (m *Monitor) DetectChanges(markets []models.Market, window time.Duration) (
 // Both probabilities are clamped to [1e-7, 1-1e-7] to avoid ln(0).
 // Returns the information gain (in nats) of updating from pOld to pNew.
 func KLDivergence(pOld, pNew float64) float64 {
-	pOld = math.Max(probEpsilon, math.Min(1-probEpsilon, pOld))
-	pNew = math.Max(probEpsilon, math.Min(1-probEpsilon, pNew))
+	pOld = min(max(pOld, probEpsilon), 1-probEpsilon)
+	pNew = min(max(pNew, probEpsilon), 1-probEpsilon)
 	return pNew*math.Log(pNew/pOld) + (1-pNew)*math.Log((1-pNew)/(1-pOld))
 }
 
@@ -159,7 +168,7 @@ func LogVolumeWeight(volume24h, vRef float64) float64 {
 	if vRef <= 0 {
 		vRef = 1.0
 	}
-	return math.Max(0.1, math.Log(1+volume24h/vRef)/math.Log(2))
+	return max(0.1, math.Log2(1+volume24h/vRef))
 }
 
 // HistoricalSNR computes the signal-to-noise ratio of netChange relative to
@@ -168,32 +177,23 @@ func LogVolumeWeight(volume24h, vRef float64) float64 {
 // Returns clamp(|netChange|/σ, 0.5, 5.0).
 // Falls back to 1.0 when fewer than 2 consecutive pairs exist or σ < 1e-4.
 func HistoricalSNR(allSnapshots []models.Snapshot, netChange float64) float64 {
-	if len(allSnapshots) < 2 {
+	// Need at least 2 consecutive deltas for Bessel-corrected std dev (divide by n-1)
+	if len(allSnapshots) < 3 {
 		return 1.0
 	}
 
-	deltas := make([]float64, len(allSnapshots)-1)
+	// Welford's single-pass variance over consecutive Δp — no intermediate
+	// delta slice and no separate mean/variance passes.
+	var mean, m2 float64
+	n := 0
 	for i := 1; i < len(allSnapshots); i++ {
-		deltas[i-1] = allSnapshots[i].YesProbability - allSnapshots[i-1].YesProbability
+		delta := allSnapshots[i].YesProbability - allSnapshots[i-1].YesProbability
+		n++
+		d := delta - mean
+		mean += d / float64(n)
+		m2 += d * (delta - mean)
 	}
-
-	// Need at least 2 deltas for Bessel-corrected std dev (divide by n-1)
-	if len(deltas) < 2 {
-		return 1.0
-	}
-
-	// Sample mean
-	var sum float64
-	for _, d := range deltas {
-		sum += d
-	}
-	mean := sum / float64(len(deltas))
-	var variance float64
-	for _, d := range deltas {
-		diff := d - mean
-		variance += diff * diff
-	}
-	variance /= float64(len(deltas) - 1)
+	variance := m2 / float64(n-1)
 	sigma := math.Sqrt(variance)
 
 	if sigma < 1e-4 {
@@ -201,7 +201,7 @@ func HistoricalSNR(allSnapshots []models.Snapshot, netChange float64) float64 {
 	}
 
 	snr := math.Abs(netChange) / sigma
-	return math.Max(0.5, math.Min(5.0, snr))
+	return min(max(snr, 0.5), 5.0)
 }
 
 // TrajectoryConsistency returns |ΣΔp| / Σ|Δp| across consecutive snapshot pairs
@@ -212,18 +212,75 @@ func TrajectoryConsistency(windowSnapshots []models.Snapshot) float64 {
 		return 1.0
 	}
 
-	var sumSigned, sumAbs float64
+	// ΣΔp telescopes to p_last − p_first, so only Σ|Δp| needs accumulating.
+	var sumAbs float64
 	for i := 1; i < len(windowSnapshots); i++ {
-		delta := windowSnapshots[i].YesProbability - windowSnapshots[i-1].YesProbability
-		sumSigned += delta
-		sumAbs += math.Abs(delta)
+		sumAbs += math.Abs(windowSnapshots[i].YesProbability - windowSnapshots[i-1].YesProbability)
 	}
 
 	if sumAbs < 1e-10 {
 		return 1.0
 	}
 
-	return math.Abs(sumSigned) / sumAbs
+	netChange := windowSnapshots[len(windowSnapshots)-1].YesProbability - windowSnapshots[0].YesProbability
+	return math.Abs(netChange) / sumAbs
+}
+
+// historyFactors computes HistoricalSNR and TrajectoryConsistency in one pass
+// over the full time-ordered snapshot history. Both factors walk the same
+// consecutive Δp sequence — SNR over all pairs, TC over the suffix at or after
+// cutoff — so fusing them halves the traversals in the scoring hot loop.
+// Results are identical to calling the two exported functions separately.
+func historyFactors(allSnapshots []models.Snapshot, netChange float64, cutoff time.Time) (snr, tc float64) {
+	snr, tc = 1.0, 1.0
+
+	// Index where the trajectory window starts (suffix semantics of snapshotsSince).
+	start := sort.Search(len(allSnapshots), func(j int) bool {
+		return !allSnapshots[j].Timestamp.Before(cutoff)
+	})
+
+	var mean, m2 float64
+	var sumAbs float64
+	n := 0
+	for i := 1; i < len(allSnapshots); i++ {
+		delta := allSnapshots[i].YesProbability - allSnapshots[i-1].YesProbability
+
+		// Welford accumulation for σ across the full history.
+		n++
+		d := delta - mean
+		mean += d / float64(n)
+		m2 += d * (delta - mean)
+
+		// Σ|Δp| across pairs fully inside the window suffix.
+		if i > start {
+			sumAbs += math.Abs(delta)
+		}
+	}
+
+	// SNR: needs ≥ 2 consecutive deltas and a non-degenerate σ.
+	if len(allSnapshots) >= 3 {
+		sigma := math.Sqrt(m2 / float64(n-1))
+		if sigma >= 1e-4 {
+			snr = min(max(math.Abs(netChange)/sigma, 0.5), 5.0)
+		}
+	}
+
+	// TC: needs ≥ 2 snapshots in the window and non-zero total movement.
+	if len(allSnapshots)-start >= 2 && sumAbs >= 1e-10 {
+		windowNet := allSnapshots[len(allSnapshots)-1].YesProbability - allSnapshots[start].YesProbability
+		tc = math.Abs(windowNet) / sumAbs
+	}
+
+	return snr, tc
+}
+
+// snapshotsSince returns the suffix of time-ordered snapshots taken at or after
+// cutoff (matching the timestamp >= cutoff semantics of GetSnapshotsInWindow).
+func snapshotsSince(snapshots []models.Snapshot, cutoff time.Time) []models.Snapshot {
+	i := sort.Search(len(snapshots), func(j int) bool {
+		return !snapshots[j].Timestamp.Before(cutoff)
+	})
+	return snapshots[i:]
 }
 
 // CompositeScore multiplies the four factors into a single signal quality scalar.
@@ -235,8 +292,9 @@ func CompositeScore(kl, vw, snr, tc float64) float64 {
 // back to EventID when OriginalEventID is empty). Markets within each group are
 // sorted by SignalScore descending. Insertion order of groups is preserved.
 func groupByEvent(changes []models.Change) []models.Event {
-	groupMap := make(map[string]*models.Event)
-	var order []string
+	// Sized for the worst case of every change belonging to a distinct event.
+	groupMap := make(map[string]*models.Event, len(changes))
+	order := make([]string, 0, len(changes))
 
 	for _, change := range changes {
 		id := change.OriginalEventID
@@ -262,8 +320,8 @@ func groupByEvent(changes []models.Change) []models.Event {
 	result := make([]models.Event, 0, len(order))
 	for _, id := range order {
 		g := *groupMap[id]
-		sort.Slice(g.Markets, func(a, b int) bool {
-			return g.Markets[a].SignalScore > g.Markets[b].SignalScore
+		slices.SortFunc(g.Markets, func(a, b models.Change) int {
+			return cmp.Compare(b.SignalScore, a.SignalScore)
 		})
 		result = append(result, g)
 	}
@@ -295,7 +353,9 @@ func (m *Monitor) ScoreAndRank(
 		vRef = 25000.0
 	}
 
-	var candidates []models.Change
+	// Pass 1: apply the cheap pre-score filters so snapshot history is only
+	// fetched for changes that can actually be scored.
+	eligible := make([]models.Change, 0, len(changes))
 
 	for _, change := range changes {
 		// Pre-score filter 1: minimum absolute probability change.
@@ -319,23 +379,42 @@ func (m *Monitor) ScoreAndRank(
 			continue
 		}
 
-		market, ok := markets[change.EventID]
-		if !ok {
+		if _, ok := markets[change.EventID]; !ok {
 			logger.Warn("ScoreAndRank: market %s not found in map, skipping", change.EventID)
 			continue
 		}
 
-		allSnaps, err := m.storage.GetSnapshots(change.EventID)
-		snr := 1.0
-		if err == nil {
-			snr = HistoricalSNR(allSnaps, change.NewProbability-change.OldProbability)
-		}
+		eligible = append(eligible, change)
+	}
 
-		winSnaps, err := m.storage.GetSnapshotsInWindow(change.EventID, change.TimeWindow)
-		tc := 1.0
-		if err == nil {
-			tc = TrajectoryConsistency(winSnaps)
+	// Fetch snapshot history for all surviving candidates in one batched query
+	// instead of one query per candidate. On failure both history-based factors
+	// fall back to 1.0, as before.
+	ids := make([]string, 0, len(eligible))
+	seen := make(map[string]bool, len(eligible))
+	for _, change := range eligible {
+		if !seen[change.EventID] {
+			seen[change.EventID] = true
+			ids = append(ids, change.EventID)
 		}
+	}
+	snapsByMarket, err := m.storage.GetSnapshotsForMarkets(ids)
+	if err != nil {
+		logger.Warn("ScoreAndRank: failed to load snapshot history, SNR/TC fall back to 1.0: %v", err)
+		snapsByMarket = nil
+	}
+
+	// Pass 2: score the candidates. One clock read serves every cutoff.
+	now := time.Now()
+	candidates := make([]models.Change, 0, len(eligible))
+
+	for _, change := range eligible {
+		market := markets[change.EventID]
+
+		// The trajectory window is a suffix of the full time-ordered history,
+		// so both history factors come from one fused pass over it.
+		allSnaps := snapsByMarket[change.EventID]
+		snr, tc := historyFactors(allSnaps, change.NewProbability-change.OldProbability, now.Add(-change.TimeWindow))
 
 		kl := KLDivergence(change.OldProbability, change.NewProbability)
 		vw := LogVolumeWeight(market.Volume24hr, vRef)
@@ -347,23 +426,64 @@ func (m *Monitor) ScoreAndRank(
 		}
 	}
 
-	groups := groupByEvent(candidates)
+	return topKEvents(groupByEvent(candidates), k)
+}
 
-	sort.Slice(groups, func(i, j int) bool {
-		if groups[i].BestScore != groups[j].BestScore {
-			return groups[i].BestScore > groups[j].BestScore
-		}
-		// Tie-break: ID lexicographic descending
-		return groups[i].ID > groups[j].ID
-	})
+// lessEvent orders event groups ascending by BestScore, ties broken by ID
+// lexicographic ascending — the inverse of the final ranking order.
+func lessEvent(a, b models.Event) bool {
+	if a.BestScore != b.BestScore {
+		return a.BestScore < b.BestScore
+	}
+	return a.ID < b.ID
+}
+
+// eventHeap is a min-heap on (BestScore, ID) holding the current top-k groups
+// during selection; the weakest candidate sits at the root for cheap eviction.
+type eventHeap []models.Event
+
+func (h eventHeap) Len() int           { return len(h) }
+func (h eventHeap) Less(i, j int) bool { return lessEvent(h[i], h[j]) }
+func (h eventHeap) Swap(i, j int)      { h[i], h[j] = h[j], h[i] }
+func (h *eventHeap) Push(x any)        { *h = append(*h, x.(models.Event)) }
+func (h *eventHeap) Pop() any {
+	old := *h
+	x := old[len(old)-1]
+	*h = old[:len(old)-1]
+	return x
+}
 
+// topKEvents selects the k highest-ranked groups with a bounded min-heap
+// (O(n log k) instead of a full O(n log n) sort), then orders just those k by
+// BestScore descending with ID descending tie-breaks for determinism.
+// Returns an empty (non-nil) slice when k <= 0 or there are no groups.
+func topKEvents(groups []models.Event, k int) []models.Event {
 	if k <= 0 || len(groups) == 0 {
 		return []models.Event{}
 	}
 	if k > len(groups) {
 		k = len(groups)
 	}
-	return groups[:k]
+
+	h := make(eventHeap, 0, k)
+	for _, g := range groups {
+		if len(h) < k {
+			heap.Push(&h, g)
+		} else if lessEvent(h[0], g) {
+			h[0] = g
+			heap.Fix(&h, 0)
+		}
+	}
+
+	// Final presentation order: the descending mirror of lessEvent.
+	result := []models.Event(h)
+	slices.SortFunc(result, func(a, b models.Event) int {
+		if a.BestScore != b.BestScore {
+			return cmp.Compare(b.BestScore, a.BestScore)
+		}
+		return cmp.Compare(b.ID, a.ID)
+	})
+	return result
 }
 
 // isDeterministicZone returns true when a probability is in the high-conviction
@@ -377,10 +497,22 @@ func isDeterministicZone(p float64) bool {
 // Groups that become empty after filtering are dropped. Returns a non-nil slice.
 func (m *Monitor) FilterRecentlySent(groups []models.Event, cooldown time.Duration) []models.Event {
 	now := time.Now()
+
+	// Evict records past their cooldown so the map stays bounded by the set of
+	// recently-notified markets instead of growing for the life of the process.
+	for id, rec := range m.notifiedMarkets {
+		if now.Sub(rec.SentAt) >= cooldown {
+			delete(m.notifiedMarkets, id)
+		}
+	}
+
 	var result []models.Event
 
 	for _, group := range groups {
+		// Track the surviving best score during the filter pass instead of
+		// re-scanning the filtered slice afterwards.
 		var filtered []models.Change
+		bestScore := 0.0
 		for _, change := range group.Markets {
 			compositeID := change.EventID
 			rec, exists := m.notifiedMarkets[compositeID]
@@ -393,6 +525,9 @@ func (m *Monitor) FilterRecentlySent(groups []models.Event, cooldown time.Durati
 				}
 			}
 			filtered = append(filtered, change)
+			if change.SignalScore > bestScore {
+				bestScore = change.SignalScore
+			}
 		}
 
 		if len(filtered) == 0 {
@@ -401,12 +536,7 @@ func (m *Monitor) FilterRecentlySent(groups []models.Event, cooldown time.Durati
 
 		newGroup := group
 		newGroup.Markets = filtered
-		newGroup.BestScore = 0
-		for _, c := range filtered {
-			if c.SignalScore > newGroup.BestScore {
-				newGroup.BestScore = c.SignalScore
-			}
-		}
+		newGroup.BestScore = bestScore
 		result = append(result, newGroup)
 	}
 
@@ -67,7 +67,7 @@ func TestDetectChanges(t *testing.T) {
 		}
 	}
 
-	markets := []models.Market{market}
+	markets := []*models.Market{&market}
 	changes, _, err := m.DetectChanges(markets, 2*time.Hour)
 	if err != nil {
 		t.Fatalf("DetectChanges failed: %v", err)
@@ -131,7 +131,7 @@ func TestDetectChanges_BelowThreshold(t *testing.T) {
 		}
 	}
 
-	markets := []models.Market{market}
+	markets := []*models.Market{&market}
 	changes, _, err := m.DetectChanges(markets, 2*time.Hour)
 	if err != nil {
 		t.Fatalf("DetectChanges failed: %v", err)
@@ -195,7 +195,7 @@ func TestDetectChanges_OutOfOrderSnapshots(t *testing.T) {
 		}
 	}
 
-	markets := []models.Market{market}
+	markets := []*models.Market{&market}
 	changes, _, err := m.DetectChanges(markets, 3*time.Hour)
 	if err != nil {
 		t.Fatalf("DetectChanges failed: %v", err)
@@ -465,6 +465,43 @@ func TestTrajectoryConsistency(t *testing.T) {
 	}
 }
 
+// historyFactors fuses HistoricalSNR and TrajectoryConsistency into one pass;
+// it must agree exactly with the separate functions for every cutoff position,
+// including degenerate histories.
+func TestHistoryFactors(t *testing.T) {
+	cases := [][]float64{
+		nil,
+		{0.5},
+		{0.5, 0.6},
+		{0.5, 0.5, 0.5, 0.5},
+		{0.50, 0.55, 0.60, 0.65},
+		{0.50, 0.60, 0.50, 0.60, 0.50},
+		{0.50, 0.55, 0.60, 0.55, 0.65, 0.30, 0.31},
+	}
+	const netChange = 0.07
+
+	for _, probs := range cases {
+		snaps := makeSnaps(probs)
+		for cut := 0; cut <= len(snaps); cut++ {
+			var cutoff time.Time
+			if cut < len(snaps) {
+				cutoff = snaps[cut].Timestamp
+			} else if len(snaps) > 0 {
+				cutoff = snaps[len(snaps)-1].Timestamp.Add(time.Minute)
+			}
+
+			wantSNR := HistoricalSNR(snaps, netChange)
+			wantTC := TrajectoryConsistency(snapshotsSince(snaps, cutoff))
+			gotSNR, gotTC := historyFactors(snaps, netChange, cutoff)
+
+			if gotSNR != wantSNR || gotTC != wantTC {
+				t.Errorf("historyFactors(probs=%v, cut=%d) = (%v, %v), want (%v, %v)",
+					probs, cut, gotSNR, gotTC, wantSNR, wantTC)
+			}
+		}
+	}
+}
+
 // ─── T015: TestScoring — 8 comprehensive cases ───────────────────────────────
 
 func TestScoring(t *testing.T) {
@@ -604,6 +641,37 @@ func TestScoring(t *testing.T) {
 	})
 }
 
+func TestTopKEvents(t *testing.T) {
+	groups := []models.Event{
+		{ID: "e1", BestScore: 0.5},
+		{ID: "e2", BestScore: 0.9},
+		{ID: "e3", BestScore: 0.1},
+		{ID: "e4", BestScore: 0.9}, // ties with e2 — higher ID ranks first
+		{ID: "e5", BestScore: 0.7},
+	}
+
+	top := topKEvents(groups, 3)
+	wantIDs := []string{"e4", "e2", "e5"}
+	if len(top) != len(wantIDs) {
+		t.Fatalf("got %d groups, want %d", len(top), len(wantIDs))
+	}
+	for i, want := range wantIDs {
+		if top[i].ID != want {
+			t.Errorf("position %d: got %s, want %s", i, top[i].ID, want)
+		}
+	}
+
+	if got := topKEvents(groups, 0); got == nil || len(got) != 0 {
+		t.Errorf("k=0: got %v, want empty non-nil slice", got)
+	}
+	if got := topKEvents(nil, 3); got == nil || len(got) != 0 {
+		t.Errorf("no groups: got %v, want empty non-nil slice", got)
+	}
+	if got := topKEvents(groups, 10); len(got) != len(groups) {
+		t.Errorf("k > len: got %d groups, want %d", len(got), len(groups))
+	}
+}
+
 // ─── ScoreAndRank integration tests ──────────────────────────────────────────
 
 func TestScoreAndRank_TopKLimit(t *testing.T) {
@@ -1375,3 +1443,28 @@ func TestFilterRecentlySent_PassesAfterCooldown(t *testing.T) {
 		t.Errorf("Expected 1 group after cooldown expired, got %d", len(filtered))
 	}
 }
+
+// TestFilterRecentlySent_PrunesExpired verifies that records past their cooldown
+// are evicted from the tracking map so it stays bounded.
+func TestFilterRecentlySent_PrunesExpired(t *testing.T) {
+	store := mustStorage(t, 100, 50)
+	mon := New(store)
+
+	mon.notifiedMarkets["expired"] = notifiedRecord{
+		Direction: "increase", NewProb: 0.60,
+		SentAt: time.Now().Add(-2 * time.Hour),
+	}
+	mon.notifiedMarkets["fresh"] = notifiedRecord{
+		Direction: "increase", NewProb: 0.60,
+		SentAt: time.Now().Add(-time.Minute),
+	}
+
+	mon.FilterRecentlySent([]models.Event{}, time.Hour)
+
+	if _, exists := mon.notifiedMarkets["expired"]; exists {
+		t.Error("expired record should have been pruned")
+	}
+	if _, exists := mon.notifiedMarkets["fresh"]; !exists {
+		t.Error("fresh record should have been kept")
+	}
+}
@@ -12,6 +12,7 @@ import (
 	"fmt"
 	"net/http"
 	"net/url"
+	"strconv"
 	"strings"
 	"time"
 
@@ -26,6 +27,12 @@ type Client struct {
 	timeout        time.Duration
 	maxRetries     int
 	retryDelayBase time.Duration
+
+	// eventsURL is the parsed Gamma events endpoint, memoized at construction
+	// since the base URL never changes; eventsURLErr defers a bad base URL to
+	// the first FetchEvents call (NewClient does not return an error).
+	eventsURL    *url.URL
+	eventsURLErr error
 }
 
 // PolymarketEvent represents an event from Polymarket Gamma API
@@ -104,9 +111,13 @@ func NewClient(gammaAPIURL, clobAPIURL string, timeout time.Duration, cfg ...Cli
 		}
 	}
 
+	eventsURL, eventsURLErr := url.Parse(gammaAPIURL + "/events")
+
 	return &Client{
-		gammaAPIURL: gammaAPIURL,
-		clobAPIURL:  clobAPIURL,
+		gammaAPIURL:  gammaAPIURL,
+		clobAPIURL:   clobAPIURL,
+		eventsURL:    eventsURL,
+		eventsURLErr: eventsURLErr,
 		httpClient: &http.Client{
 			Timeout: timeout,
 			Transport: &http.Transport{
@@ -136,24 +147,24 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 	const pageSize = 500 // API max per request
 	maxFetch := limit * 3
 
-	// Paginate through results
-	for offset := 0; offset < maxFetch; offset += pageSize {
-		// Build URL with query parameters
-		u, err := url.Parse(c.gammaAPIURL + "/events")
-		if err != nil {
-			return nil, fmt.Errorf("failed to parse URL: %w", err)
-		}
-
-		q := u.Query()
-		q.Set("active", "true")
-		q.Set("closed", "false")
-		q.Set("limit", fmt.Sprintf("%d", pageSize))
-		q.Set("offset", fmt.Sprintf("%d", offset))
+	// The endpoint URL is parsed once at client construction; copy it so the
+	// per-page offset mutation below does not touch the shared value.
+	if c.eventsURLErr != nil {
+		return nil, fmt.Errorf("failed to parse URL: %w", c.eventsURLErr)
+	}
+	u := *c.eventsURL
+	q := u.Query()
+	q.Set("active", "true")
+	q.Set("closed", "false")
+	q.Set("limit", strconv.Itoa(pageSize))
 
-		// Sort by volume24hr descending (one of the volume metrics)
-		q.Set("order", "volume24hr")
-		q.Set("ascending", "false")
+	// Sort by volume24hr descending (one of the volume metrics)
+	q.Set("order", "volume24hr")
+	q.Set("ascending", "false")
 
+	// Paginate through results
+	for offset := 0; offset < maxFetch; offset += pageSize {
+		q.Set("offset", strconv.Itoa(offset))
 		u.RawQuery = q.Encode()
 
 		resp, err := c.doRequest(ctx, u.String())
@@ -168,21 +179,28 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 			return nil, fmt.Errorf("unexpected content type: %s (expected application/json)", contentType)
 		}
 
-		// Response is array directly, not wrapped
-		var pmEvents []PolymarketEvent
-		if err := json.NewDecoder(resp.Body).Decode(&pmEvents); err != nil {
+		// Response is array directly, not wrapped. Stream-decode it one event at
+		// a time so filtered-out events are dropped before a whole page of them
+		// is materialized in memory.
+		dec := json.NewDecoder(resp.Body)
+		tok, err := dec.Token()
+		if err != nil {
 			_ = resp.Body.Close()
 			return nil, fmt.Errorf("failed to decode events JSON: %w", err)
 		}
-		_ = resp.Body.Close()
-
-		// No more events
-		if len(pmEvents) == 0 {
-			break
+		if delim, ok := tok.(json.Delim); !ok || delim != '[' {
+			_ = resp.Body.Close()
+			return nil, fmt.Errorf("failed to decode events JSON: expected array, got %v", tok)
 		}
 
-		// Process events from this page
-		for _, pe := range pmEvents {
+		pageCount := 0
+		for dec.More() && len(allEvents) < limit {
+			var pe PolymarketEvent
+			if err := dec.Decode(&pe); err != nil {
+				_ = resp.Body.Close()
+				return nil, fmt.Errorf("failed to decode events JSON: %w", err)
+			}
+			pageCount++
 			// Filter by category using tags (category field is often null in API)
 			if len(categories) > 0 {
 				// Check if any tag matches the requested categories
@@ -198,20 +216,17 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 				}
 			}
 
-			// Apply volume filtering (logical OR or AND)
+			// Apply volume filtering (logical OR or AND). Short-circuit the
+			// comparisons so the common first-clause hit skips the rest.
 			if vol24hrMin > 0 || vol1wkMin > 0 || vol1moMin > 0 {
-				vol24hrPass := pe.Volume24hr >= vol24hrMin
-				vol1wkPass := pe.Volume1wk >= vol1wkMin
-				vol1moPass := pe.Volume1mo >= vol1moMin
-
 				if volumeFilterOR {
 					// Logical OR: include if ANY condition passes
-					if !vol24hrPass && !vol1wkPass && !vol1moPass {
+					if !(pe.Volume24hr >= vol24hrMin || pe.Volume1wk >= vol1wkMin || pe.Volume1mo >= vol1moMin) {
 						continue
 					}
 				} else {
 					// Logical AND: include if ALL conditions pass
-					if !vol24hrPass || !vol1wkPass || !vol1moPass {
+					if !(pe.Volume24hr >= vol24hrMin && pe.Volume1wk >= vol1wkMin && pe.Volume1mo >= vol1moMin) {
 						continue
 					}
 				}
@@ -233,6 +248,12 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 				}
 			}
 
+			// Per-event values that are invariant across the market loop below.
+			// Capture current time once to ensure CreatedAt <= LastUpdated.
+			now := time.Now()
+			eventURL := "https://polymarket.com/event/" + pe.Slug
+			active := pe.Active && !pe.Closed
+
 			// Process each market individually
 			// An event can have multiple markets, and we track each one separately
 			for _, market := range pe.Markets {
@@ -246,9 +267,6 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 					continue
 				}
 
-				// Capture current time once to ensure CreatedAt <= LastUpdated
-				now := time.Now()
-
 				// Always use composite ID format for consistency
 				// This prevents data loss when events transition from single to multi-market
 				compositeID := pe.ID + ":" + market.ID
@@ -272,7 +290,7 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 					MarketID:       market.ID,
 					MarketQuestion: market.Question,
 					Title:          pe.Title,
-					EventURL:       "https://polymarket.com/event/" + pe.Slug,
+					EventURL:       eventURL,
 					Description:    pe.Description,
 					Category:       primaryCategory,
 					Subcategory:    pe.Subcategory,
@@ -282,22 +300,32 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 					Volume1wk:      marketVolume1wk,
 					Volume1mo:      marketVolume1mo,
 					Liquidity:      pe.Liquidity,
-					Active:         pe.Active && !pe.Closed,
+					Active:         active,
 					LastUpdated:    now,
 					CreatedAt:      now,
 				}
 
 				allEvents = append(allEvents, event)
+				if len(allEvents) >= limit {
+					break
+				}
 			}
 		}
+		_ = resp.Body.Close()
+
+		// Stop as soon as we have enough events — markets past the limit would
+		// only be built and then truncated away below.
+		if len(allEvents) >= limit {
+			break
+		}
 
-		// Stop if we got fewer than pageSize (last page)
-		if len(pmEvents) < pageSize {
+		// No more events
+		if pageCount == 0 {
 			break
 		}
 
-		// Stop if we have enough events
-		if len(allEvents) >= maxFetch {
+		// Stop if we got fewer than pageSize (last page)
+		if pageCount < pageSize {
 			break
 		}
 	}
@@ -312,27 +340,39 @@ func (c *Client) FetchEvents(ctx context.Context, categories []string, vol24hrMi
 
 // parseMarketProbabilities extracts Yes/No probabilities from a market
 func parseMarketProbabilities(market PolymarketMarket) (float64, float64, error) {
-	// Parse outcomes JSON string
+	// Fast path: both fields in the canonical two-element form (the near-universal
+	// case for binary markets) — split the strings directly and skip two
+	// json.Unmarshal invocations per market.
+	if o0, o1, ok := parseTwoQuoted(market.Outcomes); ok {
+		if p0, p1, ok := parseTwoQuoted(market.OutcomePrices); ok {
+			return probsFromPairs([]string{o0, o1}, []string{p0, p1})
+		}
+	}
+
+	// Slow path: full JSON decode for anything non-canonical.
 	var outcomes []string
 	if err := json.Unmarshal([]byte(market.Outcomes), &outcomes); err != nil {
 		return 0, 0, fmt.Errorf("failed to parse outcomes: %w", err)
 	}
 
-	// Parse outcome prices JSON string
 	var outcomePrices []string
 	if err := json.Unmarshal([]byte(market.OutcomePrices), &outcomePrices); err != nil {
 		return 0, 0, fmt.Errorf("failed to parse outcome prices: %w", err)
 	}
 
-	// Extract Yes/No probabilities
+	return probsFromPairs(outcomes, outcomePrices)
+}
+
+// probsFromPairs extracts Yes/No probabilities from parallel outcome/price lists.
+func probsFromPairs(outcomes, outcomePrices []string) (float64, float64, error) {
 	var yesProb, noProb float64
 	for i, outcome := range outcomes {
 		if i >= len(outcomePrices) {
 			break
 		}
 
-		var price float64
-		if _, err := fmt.Sscanf(outcomePrices[i], "%f", &price); err != nil {
+		price, err := strconv.ParseFloat(outcomePrices[i], 64)
+		if err != nil {
 			return 0, 0, fmt.Errorf("failed to parse price '%s': %w", outcomePrices[i], err)
 		}
 
@@ -347,6 +387,43 @@ func parseMarketProbabilities(market PolymarketMarket) (float64, float64, error)
 	return yesProb, noProb, nil
 }
 
+// parseTwoQuoted extracts the two elements of a `["a", "b"]` JSON string without
+// invoking the JSON decoder. Returns ok=false for anything beyond two plain
+// quoted strings (escapes, other element counts, non-string elements), sending
+// the caller to the full decoder instead.
+func parseTwoQuoted(s string) (first, second string, ok bool) {
+	s = strings.TrimSpace(s)
+	if len(s) < 2 || s[0] != '[' || s[len(s)-1] != ']' {
+		return "", "", false
+	}
+	inner := s[1 : len(s)-1]
+	comma := strings.IndexByte(inner, ',')
+	if comma < 0 {
+		return "", "", false
+	}
+	if first, ok = unquoteSimple(inner[:comma]); !ok {
+		return "", "", false
+	}
+	if second, ok = unquoteSimple(inner[comma+1:]); !ok {
+		return "", "", false
+	}
+	return first, second, true
+}
+
+// unquoteSimple strips surrounding quotes from a plain JSON string with no
+// escapes or embedded quotes.
+func unquoteSimple(s string) (string, bool) {
+	s = strings.TrimSpace(s)
+	if len(s) < 2 || s[0] != '"' || s[len(s)-1] != '"' {
+		return "", false
+	}
+	inner := s[1 : len(s)-1]
+	if strings.ContainsAny(inner, `"\`) {
+		return "", false
+	}
+	return inner, true
+}
+
 // containsJSON checks if a content-type header indicates JSON
 func containsJSON(contentType string) bool {
 	return contentType == "application/json" ||
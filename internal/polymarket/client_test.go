@@ -527,6 +527,34 @@ func TestParseMarketProbabilities(t *testing.T) {
 	}
 }
 
+func TestParseTwoQuoted(t *testing.T) {
+	tests := []struct {
+		input      string
+		wantFirst  string
+		wantSecond string
+		wantOK     bool
+	}{
+		{`["Yes", "No"]`, "Yes", "No", true},
+		{`["0.75","0.25"]`, "0.75", "0.25", true},
+		{` [ "a" , "b" ] `, "a", "b", true},
+		{`["", "0.25"]`, "", "0.25", true},
+		{`["only"]`, "", "", false},
+		{`["a", "b", "c"]`, "", "", false},
+		{`["a \"quoted\"", "b"]`, "", "", false},
+		{`[1, 2]`, "", "", false},
+		{`not valid json`, "", "", false},
+		{``, "", "", false},
+	}
+
+	for _, tt := range tests {
+		first, second, ok := parseTwoQuoted(tt.input)
+		if ok != tt.wantOK || first != tt.wantFirst || second != tt.wantSecond {
+			t.Errorf("parseTwoQuoted(%q) = (%q, %q, %v), want (%q, %q, %v)",
+				tt.input, first, second, ok, tt.wantFirst, tt.wantSecond, tt.wantOK)
+		}
+	}
+}
+
 func TestContainsJSON(t *testing.T) {
 	tests := []struct {
 		input    string
@@ -7,6 +7,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"strings"
 	"time"
 
 	"github.com/rewired-gh/polyoracle/internal/models"
@@ -18,6 +19,13 @@ type Storage struct {
 	db                   *sql.DB
 	maxMarkets           int
 	maxSnapshotsPerEvent int
+
+	// Statements executed once per market/snapshot/change every cycle are
+	// prepared once at startup so SQLite does not reparse them per call.
+	upsertMarketStmt     *sql.Stmt
+	enforceMarketCapStmt *sql.Stmt
+	addSnapshotStmt      *sql.Stmt
+	addChangeStmt        *sql.Stmt
 }
 
 // New opens (or creates) the SQLite database at dbPath.
@@ -45,11 +53,19 @@ func New(maxMarkets, maxSnapshotsPerEvent int, dbPath string) (*Storage, error)
 	if err := s.createTables(); err != nil {
 		return nil, fmt.Errorf("failed to create tables: %w", err)
 	}
+	if err := s.prepareStatements(); err != nil {
+		return nil, fmt.Errorf("failed to prepare statements: %w", err)
+	}
 	return s, nil
 }
 
-// Close closes the underlying database connection.
+// Close closes the prepared statements and the underlying database connection.
 func (s *Storage) Close() error {
+	for _, stmt := range []*sql.Stmt{s.upsertMarketStmt, s.enforceMarketCapStmt, s.addSnapshotStmt, s.addChangeStmt} {
+		if stmt != nil {
+			_ = stmt.Close()
+		}
+	}
 	return s.db.Close()
 }
 
@@ -118,6 +134,48 @@ func (s *Storage) createTables() error {
 	return nil
 }
 
+func (s *Storage) prepareStatements() error {
+	var err error
+	if s.upsertMarketStmt, err = s.db.Prepare(`
+		INSERT INTO markets
+			(id, event_id, market_id, market_question, title, event_url, description,
+			 category, subcategory, yes_prob, no_prob, volume_24hr, volume_1wk, volume_1mo,
+			 liquidity, active, closed, last_updated, created_at)
+		VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+		ON CONFLICT(id) DO UPDATE SET
+			event_id=excluded.event_id, market_id=excluded.market_id,
+			market_question=excluded.market_question, title=excluded.title,
+			event_url=excluded.event_url, description=excluded.description,
+			category=excluded.category, subcategory=excluded.subcategory,
+			yes_prob=excluded.yes_prob, no_prob=excluded.no_prob,
+			volume_24hr=excluded.volume_24hr, volume_1wk=excluded.volume_1wk,
+			volume_1mo=excluded.volume_1mo, liquidity=excluded.liquidity,
+			active=excluded.active, closed=excluded.closed,
+			last_updated=excluded.last_updated`); err != nil {
+		return err
+	}
+	if s.enforceMarketCapStmt, err = s.db.Prepare(`
+		DELETE FROM markets WHERE id NOT IN (
+			SELECT id FROM markets ORDER BY last_updated DESC LIMIT ?
+		)`); err != nil {
+		return err
+	}
+	if s.addSnapshotStmt, err = s.db.Prepare(`
+		INSERT INTO snapshots (id, market_id, yes_prob, no_prob, timestamp, source)
+		VALUES (?,?,?,?,?,?)`); err != nil {
+		return err
+	}
+	if s.addChangeStmt, err = s.db.Prepare(`
+		INSERT INTO changes
+			(id, market_id, original_event_id, event_title, event_url, polymarket_market_id,
+			 market_question, magnitude, direction, old_prob, new_prob, time_window,
+			 detected_at, notified, signal_score)
+		VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)`); err != nil {
+		return err
+	}
+	return nil
+}
+
 // --- Markets ---
 
 func (s *Storage) AddMarket(market *models.Market) error {
@@ -158,6 +216,40 @@ func (s *Storage) AddMarket(market *models.Market) error {
 	return tx.Commit()
 }
 
+// UpsertMarket inserts the market or, when a row with the same ID exists,
+// updates it in place while preserving the original created_at. One statement
+// replaces the read-then-insert-or-update round-trips the monitoring cycle
+// previously issued per market.
+func (s *Storage) UpsertMarket(market *models.Market) error {
+	if err := market.Validate(); err != nil {
+		return fmt.Errorf("invalid market: %w", err)
+	}
+	tx, err := s.db.Begin()
+	if err != nil {
+		return fmt.Errorf("failed to begin transaction: %w", err)
+	}
+	defer tx.Rollback() //nolint:errcheck
+
+	_, err = tx.Stmt(s.upsertMarketStmt).Exec(
+		market.ID, market.EventID, market.MarketID, market.MarketQuestion, market.Title,
+		market.EventURL, market.Description, market.Category, market.Subcategory,
+		market.YesProbability, market.NoProbability,
+		market.Volume24hr, market.Volume1wk, market.Volume1mo, market.Liquidity,
+		boolToInt(market.Active), boolToInt(market.Closed),
+		market.LastUpdated.UnixNano(), market.CreatedAt.UnixNano(),
+	)
+	if err != nil {
+		return fmt.Errorf("failed to upsert market: %w", err)
+	}
+
+	// Evict oldest market(s) if we exceed the cap (cascades to snapshots).
+	if _, err = tx.Stmt(s.enforceMarketCapStmt).Exec(s.maxMarkets); err != nil {
+		return fmt.Errorf("failed to enforce market cap: %w", err)
+	}
+
+	return tx.Commit()
+}
+
 func (s *Storage) GetMarket(id string) (*models.Market, error) {
 	row := s.db.QueryRow(`SELECT `+marketCols+` FROM markets WHERE id = ?`, id)
 	m, err := scanMarket(row.Scan)
@@ -224,26 +316,66 @@ func (s *Storage) AddSnapshot(snapshot *models.Snapshot) error {
 	if err := snapshot.Validate(); err != nil {
 		return fmt.Errorf("invalid snapshot: %w", err)
 	}
-	var count int
-	if err := s.db.QueryRow(`SELECT COUNT(*) FROM markets WHERE id = ?`, snapshot.EventID).Scan(&count); err != nil {
-		return fmt.Errorf("failed to verify market: %w", err)
-	}
-	if count == 0 {
-		return fmt.Errorf("market not found: %s", snapshot.EventID)
-	}
-	_, err := s.db.Exec(`
-		INSERT INTO snapshots (id, market_id, yes_prob, no_prob, timestamp, source)
-		VALUES (?,?,?,?,?,?)`,
+	_, err := s.addSnapshotStmt.Exec(
 		snapshot.ID, snapshot.EventID,
 		snapshot.YesProbability, snapshot.NoProbability,
 		snapshot.Timestamp.UnixNano(), snapshot.Source,
 	)
 	if err != nil {
+		// The foreign key on market_id already rejects orphan snapshots, so a
+		// pre-insert existence check would be a redundant round-trip. Map the
+		// constraint violation back to the friendlier error.
+		if strings.Contains(err.Error(), "FOREIGN KEY constraint") {
+			return fmt.Errorf("market not found: %s", snapshot.EventID)
+		}
 		return fmt.Errorf("failed to insert snapshot: %w", err)
 	}
 	return nil
 }
 
+// AddSnapshots inserts a cycle's snapshots in one transaction using a single
+// prepared statement, amortizing per-insert overhead across the batch. Invalid
+// or orphaned snapshots are skipped and reported individually in the returned
+// slice; only transaction-level failures abort the whole batch.
+func (s *Storage) AddSnapshots(snapshots []*models.Snapshot) ([]error, error) {
+	if len(snapshots) == 0 {
+		return nil, nil
+	}
+	tx, err := s.db.Begin()
+	if err != nil {
+		return nil, fmt.Errorf("failed to begin transaction: %w", err)
+	}
+	defer tx.Rollback() //nolint:errcheck
+
+	stmt := tx.Stmt(s.addSnapshotStmt)
+	defer stmt.Close()
+
+	var failed []error
+	for _, snapshot := range snapshots {
+		if err := snapshot.Validate(); err != nil {
+			failed = append(failed, fmt.Errorf("invalid snapshot for market %s: %w", snapshot.EventID, err))
+			continue
+		}
+		if _, err := stmt.Exec(
+			snapshot.ID, snapshot.EventID,
+			snapshot.YesProbability, snapshot.NoProbability,
+			snapshot.Timestamp.UnixNano(), snapshot.Source,
+		); err != nil {
+			if strings.Contains(err.Error(), "FOREIGN KEY constraint") {
+				failed = append(failed, fmt.Errorf("market not found: %s", snapshot.EventID))
+			} else {
+				failed = append(failed, fmt.Errorf("failed to insert snapshot for market %s: %w", snapshot.EventID, err))
+			}
+			continue
+		}
+	}
+
+	if err := tx.Commit(); err != nil {
+		return failed, fmt.Errorf("failed to commit snapshots: %w", err)
+	}
+	return failed, nil
+}
+
 func (s *Storage) GetSnapshots(marketID string) ([]models.Snapshot, error) {
 	rows, err := s.db.Query(`
 		SELECT id, market_id, yes_prob, no_prob, timestamp, source
@@ -252,7 +384,46 @@ func (s *Storage) GetSnapshots(marketID string) ([]models.Snapshot, error) {
 		return nil, fmt.Errorf("failed to query snapshots: %w", err)
 	}
 	defer rows.Close()
-	return scanSnapshots(rows)
+	return scanSnapshots(rows, s.maxSnapshotsPerEvent)
+}
+
+// GetSnapshotsInWindowAll returns every snapshot inside the time window, grouped
+// by market ID with each group ordered by timestamp ascending. One query replaces
+// a per-market GetSnapshotsInWindow round-trip when the caller needs all markets.
+func (s *Storage) GetSnapshotsInWindowAll(window time.Duration) (map[string][]models.Snapshot, error) {
+	cutoff := time.Now().Add(-window).UnixNano()
+	rows, err := s.db.Query(`
+		SELECT id, market_id, yes_prob, no_prob, timestamp, source
+		FROM snapshots WHERE timestamp >= ? ORDER BY market_id, timestamp ASC`,
+		cutoff)
+	if err != nil {
+		return nil, fmt.Errorf("failed to query snapshots in window: %w", err)
+	}
+	defer rows.Close()
+	return scanSnapshotsGrouped(rows)
+}
+
+// GetSnapshotsForMarkets returns the full snapshot history for the given market
+// IDs in a single query, grouped by market ID with each group ordered by
+// timestamp ascending. Markets without snapshots are absent from the map.
+func (s *Storage) GetSnapshotsForMarkets(marketIDs []string) (map[string][]models.Snapshot, error) {
+	if len(marketIDs) == 0 {
+		return map[string][]models.Snapshot{}, nil
+	}
+	placeholders := strings.TrimSuffix(strings.Repeat("?,", len(marketIDs)), ",")
+	args := make([]any, len(marketIDs))
+	for i, id := range marketIDs {
+		args[i] = id
+	}
+	rows, err := s.db.Query(`
+		SELECT id, market_id, yes_prob, no_prob, timestamp, source
+		FROM snapshots WHERE market_id IN (`+placeholders+`)
+		ORDER BY market_id, timestamp ASC`, args...)
+	if err != nil {
+		return nil, fmt.Errorf("failed to query snapshots for markets: %w", err)
+	}
+	defer rows.Close()
+	return scanSnapshotsGrouped(rows)
 }
 
 func (s *Storage) GetSnapshotsInWindow(marketID string, window time.Duration) ([]models.Snapshot, error) {
@@ -265,7 +436,7 @@ func (s *Storage) GetSnapshotsInWindow(marketID string, window time.Duration) ([
 		return nil, fmt.Errorf("failed to query snapshots in window: %w", err)
 	}
 	defer rows.Close()
-	return scanSnapshots(rows)
+	return scanSnapshots(rows, s.maxSnapshotsPerEvent)
 }
 
 // --- Changes ---
@@ -274,12 +445,7 @@ func (s *Storage) AddChange(change *models.Change) error {
 	if err := change.Validate(); err != nil {
 		return fmt.Errorf("invalid change: %w", err)
 	}
-	_, err := s.db.Exec(`
-		INSERT INTO changes
-			(id, market_id, original_event_id, event_title, event_url, polymarket_market_id,
-			 market_question, magnitude, direction, old_prob, new_prob, time_window,
-			 detected_at, notified, signal_score)
-		VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)`,
+	_, err := s.addChangeStmt.Exec(
 		change.ID, change.EventID, change.OriginalEventID, change.EventTitle, change.EventURL,
 		change.MarketID, change.MarketQuestion,
 		change.Magnitude, change.Direction, change.OldProbability, change.NewProbability,
@@ -302,7 +468,7 @@ func (s *Storage) GetTopChanges(k int) ([]models.Change, error) {
 		return nil, fmt.Errorf("failed to query changes: %w", err)
 	}
 	defer rows.Close()
-	return scanChanges(rows)
+	return scanChanges(rows, k)
 }
 
 func (s *Storage) ClearChanges() error {
@@ -317,35 +483,19 @@ func (s *Storage) ClearChanges() error {
 // RotateSnapshots keeps at most maxSnapshotsPerEvent newest snapshots per market,
 // ordered by timestamp (not insertion order).
 func (s *Storage) RotateSnapshots() error {
-	rows, err := s.db.Query(`
-		SELECT market_id FROM snapshots
-		GROUP BY market_id HAVING COUNT(*) > ?`, s.maxSnapshotsPerEvent)
+	// Rank snapshots per market by recency and trim everything past the cap in
+	// one statement, instead of a scan plus a separate DELETE (each re-sorting
+	// that market's snapshots) for every over-cap market.
+	_, err := s.db.Exec(`
+		DELETE FROM snapshots WHERE id IN (
+			SELECT id FROM (
+				SELECT id, ROW_NUMBER() OVER (
+					PARTITION BY market_id ORDER BY timestamp DESC
+				) AS rn FROM snapshots
+			) WHERE rn > ?
+		)`, s.maxSnapshotsPerEvent)
 	if err != nil {
-		return fmt.Errorf("failed to query markets for rotation: %w", err)
-	}
-	var ids []string
-	for rows.Next() {
-		var id string
-		if err := rows.Scan(&id); err != nil {
-			rows.Close()
-			return err
-		}
-		ids = append(ids, id)
-	}
-	rows.Close()
-	if err := rows.Err(); err != nil {
-		return err
-	}
-	for _, id := range ids {
-		_, err := s.db.Exec(`
-			DELETE FROM snapshots
-			WHERE market_id = ? AND id NOT IN (
-				SELECT id FROM snapshots WHERE market_id = ?
-				ORDER BY timestamp DESC LIMIT ?
-			)`, id, id, s.maxSnapshotsPerEvent)
-		if err != nil {
-			return fmt.Errorf("failed to rotate snapshots for %s: %w", id, err)
-		}
+		return fmt.Errorf("failed to rotate snapshots: %w", err)
 	}
 	return nil
 }
@@ -390,8 +540,10 @@ func scanMarket(scan func(...any) error) (*models.Market, error) {
 	return &m, nil
 }
 
-func scanSnapshots(rows *sql.Rows) ([]models.Snapshot, error) {
-	var result []models.Snapshot
+// scanSnapshots collects rows into a slice sized by capacity up front — per-market
+// queries are bounded by the snapshot cap, so the append loop never regrows.
+func scanSnapshots(rows *sql.Rows, capacity int) ([]models.Snapshot, error) {
+	result := make([]models.Snapshot, 0, capacity)
 	for rows.Next() {
 		var s models.Snapshot
 		var tsNano int64
@@ -401,14 +553,27 @@ func scanSnapshots(rows *sql.Rows) ([]models.Snapshot, error) {
 		s.Timestamp = time.Unix(0, tsNano)
 		result = append(result, s)
 	}
-	if result == nil {
-		result = []models.Snapshot{}
+	return result, rows.Err()
+}
+
+func scanSnapshotsGrouped(rows *sql.Rows) (map[string][]models.Snapshot, error) {
+	result := make(map[string][]models.Snapshot)
+	for rows.Next() {
+		var snap models.Snapshot
+		var tsNano int64
+		if err := rows.Scan(&snap.ID, &snap.EventID, &snap.YesProbability, &snap.NoProbability, &tsNano, &snap.Source); err != nil {
+			return nil, fmt.Errorf("failed to scan snapshot: %w", err)
+		}
+		snap.Timestamp = time.Unix(0, tsNano)
+		result[snap.EventID] = append(result[snap.EventID], snap)
 	}
 	return result, rows.Err()
 }
 
-func scanChanges(rows *sql.Rows) ([]models.Change, error) {
-	var result []models.Change
+// scanChanges collects rows into a slice preallocated to capacity, matching the
+// LIMIT of the query that produced them.
+func scanChanges(rows *sql.Rows, capacity int) ([]models.Change, error) {
+	result := make([]models.Change, 0, max(capacity, 0))
 	for rows.Next() {
 		var c models.Change
 		var detectedAtNano, timeWindowNano int64
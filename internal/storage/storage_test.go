@@ -2,6 +2,7 @@ package storage
 
 import (
 	"fmt"
+	"strings"
 	"testing"
 	"time"
 
@@ -106,6 +107,36 @@ func TestStorage_GetAllMarkets(t *testing.T) {
 	}
 }
 
+func TestStorage_UpsertMarket(t *testing.T) {
+	s := newTestStorage(t)
+	created := time.Now().Add(-time.Hour)
+
+	m := testMarket("e:m", "e", "m", created)
+	m.CreatedAt = created
+	if err := s.UpsertMarket(m); err != nil {
+		t.Fatalf("UpsertMarket (insert): %v", err)
+	}
+
+	// Second upsert updates in place and preserves the original created_at
+	updated := testMarket("e:m", "e", "m", time.Now())
+	updated.YesProbability = 0.9
+	updated.NoProbability = 0.1
+	if err := s.UpsertMarket(updated); err != nil {
+		t.Fatalf("UpsertMarket (update): %v", err)
+	}
+
+	got, err := s.GetMarket("e:m")
+	if err != nil {
+		t.Fatalf("GetMarket: %v", err)
+	}
+	if got.YesProbability != 0.9 {
+		t.Errorf("YesProbability = %v, want 0.9", got.YesProbability)
+	}
+	if got.CreatedAt.UnixNano() != created.UnixNano() {
+		t.Errorf("CreatedAt = %v, want original %v", got.CreatedAt, created)
+	}
+}
+
 func TestStorage_AddSnapshot(t *testing.T) {
 	s := newTestStorage(t)
 	now := time.Now()
@@ -132,6 +163,44 @@ func TestStorage_AddSnapshot(t *testing.T) {
 	}
 }
 
+func TestStorage_AddSnapshots(t *testing.T) {
+	s := newTestStorage(t)
+	now := time.Now()
+	if err := s.AddMarket(testMarket("e:m", "e", "m", now)); err != nil {
+		t.Fatalf("AddMarket: %v", err)
+	}
+	snaps := []*models.Snapshot{
+		{ID: "s1", EventID: "e:m", YesProbability: 0.6, NoProbability: 0.4, Timestamp: now.Add(-2 * time.Minute), Source: "test"},
+		{ID: "s2", EventID: "missing:m", YesProbability: 0.5, NoProbability: 0.5, Timestamp: now.Add(-time.Minute), Source: "test"},
+		{ID: "s3", EventID: "e:m", YesProbability: 0.7, NoProbability: 0.3, Timestamp: now, Source: "test"},
+	}
+
+	failed, err := s.AddSnapshots(snaps)
+	if err != nil {
+		t.Fatalf("AddSnapshots: %v", err)
+	}
+	if len(failed) != 1 {
+		t.Fatalf("got %d failures, want 1: %v", len(failed), failed)
+	}
+	if !strings.Contains(failed[0].Error(), "market not found: missing:m") {
+		t.Errorf("unexpected failure: %v", failed[0])
+	}
+
+	// The valid rows still commit despite the orphan in the middle
+	stored, err := s.GetSnapshots("e:m")
+	if err != nil {
+		t.Fatalf("GetSnapshots: %v", err)
+	}
+	if len(stored) != 2 {
+		t.Errorf("got %d snapshots, want 2", len(stored))
+	}
+
+	// Empty batch is a no-op
+	if failed, err := s.AddSnapshots(nil); err != nil || len(failed) != 0 {
+		t.Errorf("AddSnapshots(nil) = %v, %v; want empty, nil", failed, err)
+	}
+}
+
 func TestStorage_GetSnapshotsInWindow(t *testing.T) {
 	s := newTestStorage(t)
 	now := time.Now()
@@ -170,6 +239,105 @@ func TestStorage_GetSnapshotsInWindow(t *testing.T) {
 	}
 }
 
+func TestStorage_GetSnapshotsInWindowAll(t *testing.T) {
+	s := newTestStorage(t)
+	now := time.Now()
+	for _, id := range []string{"e1:m1", "e2:m2"} {
+		if err := s.AddMarket(testMarket(id, id[:2], id[3:], now)); err != nil {
+			t.Fatalf("AddMarket: %v", err)
+		}
+	}
+
+	// Per market: snapshots at -40m (outside 30m window), -20m, -5m
+	timestamps := []time.Duration{-40 * time.Minute, -20 * time.Minute, -5 * time.Minute}
+	for _, id := range []string{"e1:m1", "e2:m2"} {
+		for i, d := range timestamps {
+			snap := &models.Snapshot{
+				ID:             fmt.Sprintf("%s-s%d", id, i),
+				EventID:        id,
+				YesProbability: 0.5,
+				NoProbability:  0.5,
+				Timestamp:      now.Add(d),
+				Source:         "test",
+			}
+			if err := s.AddSnapshot(snap); err != nil {
+				t.Fatalf("AddSnapshot: %v", err)
+			}
+		}
+	}
+
+	byMarket, err := s.GetSnapshotsInWindowAll(30 * time.Minute)
+	if err != nil {
+		t.Fatalf("GetSnapshotsInWindowAll: %v", err)
+	}
+	if len(byMarket) != 2 {
+		t.Fatalf("got %d markets, want 2", len(byMarket))
+	}
+	for _, id := range []string{"e1:m1", "e2:m2"} {
+		snaps := byMarket[id]
+		if len(snaps) != 2 {
+			t.Errorf("market %s: got %d snapshots in 30m window, want 2", id, len(snaps))
+		}
+		for i := 1; i < len(snaps); i++ {
+			if !snaps[i-1].Timestamp.Before(snaps[i].Timestamp) {
+				t.Errorf("market %s: snapshots not sorted ascending at index %d", id, i)
+			}
+		}
+	}
+}
+
+func TestStorage_GetSnapshotsForMarkets(t *testing.T) {
+	s := newTestStorage(t)
+	now := time.Now()
+	for _, id := range []string{"e1:m1", "e2:m2", "e3:m3"} {
+		if err := s.AddMarket(testMarket(id, id[:2], id[3:], now)); err != nil {
+			t.Fatalf("AddMarket: %v", err)
+		}
+		for i := 0; i < 2; i++ {
+			snap := &models.Snapshot{
+				ID:             fmt.Sprintf("%s-s%d", id, i),
+				EventID:        id,
+				YesProbability: 0.5,
+				NoProbability:  0.5,
+				Timestamp:      now.Add(time.Duration(i-2) * time.Minute),
+				Source:         "test",
+			}
+			if err := s.AddSnapshot(snap); err != nil {
+				t.Fatalf("AddSnapshot: %v", err)
+			}
+		}
+	}
+
+	// Only the requested markets come back, grouped and sorted ascending
+	byMarket, err := s.GetSnapshotsForMarkets([]string{"e1:m1", "e3:m3"})
+	if err != nil {
+		t.Fatalf("GetSnapshotsForMarkets: %v", err)
+	}
+	if len(byMarket) != 2 {
+		t.Fatalf("got %d markets, want 2", len(byMarket))
+	}
+	for _, id := range []string{"e1:m1", "e3:m3"} {
+		snaps := byMarket[id]
+		if len(snaps) != 2 {
+			t.Errorf("market %s: got %d snapshots, want 2", id, len(snaps))
+		}
+		for i := 1; i < len(snaps); i++ {
+			if !snaps[i-1].Timestamp.Before(snaps[i].Timestamp) {
+				t.Errorf("market %s: snapshots not sorted ascending at index %d", id, i)
+			}
+		}
+	}
+
+	// Empty input short-circuits without querying
+	empty, err := s.GetSnapshotsForMarkets(nil)
+	if err != nil {
+		t.Fatalf("GetSnapshotsForMarkets(nil): %v", err)
+	}
+	if len(empty) != 0 {
+		t.Errorf("got %d markets for empty input, want 0", len(empty))
+	}
+}
+
 func TestStorage_RotateSnapshots(t *testing.T) {
 	s, err := New(100, 3, ":memory:")
 	if err != nil {
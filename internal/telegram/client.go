@@ -85,10 +85,9 @@ func (c *Client) handleCommand(msg *tgbotapi.Message) {
 	}
 }
 
-// SendError sends a monitoring error notification to Telegram.
-// Call this only on the first occurrence of a consecutive error sequence.
-func (c *Client) SendError(cycleErr error) error {
-	text := fmt.Sprintf("⚠️ *Monitoring error*\n`%s`", escapeMarkdownV2(cycleErr.Error()))
+// sendWithRetry delivers a MarkdownV2 message with linear-backoff retries.
+// kind names the message in the failure error ("error message", "message", ...).
+func (c *Client) sendWithRetry(text, kind string) error {
 	msg := tgbotapi.NewMessage(c.chatID, text)
 	msg.ParseMode = "MarkdownV2"
 
@@ -101,59 +100,39 @@ func (c *Client) SendError(cycleErr error) error {
 		lastErr = err
 		time.Sleep(c.retryDelayBase * time.Duration(i+1))
 	}
-	return fmt.Errorf("failed to send error message after %d retries: %w", c.maxRetries, lastErr)
+	return fmt.Errorf("failed to send %s after %d retries: %w", kind, c.maxRetries, lastErr)
+}
+
+// SendError sends a monitoring error notification to Telegram.
+// Call this only on the first occurrence of a consecutive error sequence.
+func (c *Client) SendError(cycleErr error) error {
+	text := fmt.Sprintf("⚠️ *Monitoring error*\n`%s`", escapeMarkdownV2(cycleErr.Error()))
+	return c.sendWithRetry(text, "error message")
 }
 
 // SendRecovery sends a recovery notification to Telegram after consecutive failures.
 func (c *Client) SendRecovery(failureCount int) error {
 	text := fmt.Sprintf("✅ *Monitoring recovered* after %d consecutive failure\\(s\\)", failureCount)
-	msg := tgbotapi.NewMessage(c.chatID, text)
-	msg.ParseMode = "MarkdownV2"
-
-	var lastErr error
-	for i := 0; i < c.maxRetries; i++ {
-		_, err := c.bot.Send(msg)
-		if err == nil {
-			return nil
-		}
-		lastErr = err
-		time.Sleep(c.retryDelayBase * time.Duration(i+1))
-	}
-	return fmt.Errorf("failed to send recovery message after %d retries: %w", c.maxRetries, lastErr)
+	return c.sendWithRetry(text, "recovery message")
 }
 
 // Send sends a notification with the detected event groups
 func (c *Client) Send(groups []models.Event) error {
-	message := c.formatMessage(groups)
-
-	// Create message
-	msg := tgbotapi.NewMessage(c.chatID, message)
-	msg.ParseMode = "MarkdownV2" // Use MarkdownV2 for better escaping support
-
-	// Send with retry
-	var lastErr error
-
-	for i := 0; i < c.maxRetries; i++ {
-		_, err := c.bot.Send(msg)
-		if err == nil {
-			return nil
-		}
-		lastErr = err
-		time.Sleep(c.retryDelayBase * time.Duration(i+1))
-	}
-
-	return fmt.Errorf("failed to send message after %d retries: %w", c.maxRetries, lastErr)
+	return c.sendWithRetry(c.formatMessage(groups), "message")
 }
 
 // formatMessage formats event groups into a Telegram MarkdownV2 message.
 // Each group is one numbered entry; markets within the group appear as sub-bullets.
 func (c *Client) formatMessage(groups []models.Event) string {
-	message := "🚨 *Notable Odds Movements*\n\n"
+	// Accumulate into one builder instead of growing an immutable string with
+	// += (which reallocates and copies the whole message per append).
+	var b strings.Builder
+	b.WriteString("🚨 *Notable Odds Movements*\n\n")
 
 	// Show detected time once at the top (from the first market of the first group)
 	if len(groups) > 0 && len(groups[0].Markets) > 0 {
 		dateStr := escapeMarkdownV2(groups[0].Markets[0].DetectedAt.Format("2006-01-02 15:04:05"))
-		message += fmt.Sprintf("📅 Detected: %s\n\n", dateStr)
+		fmt.Fprintf(&b, "📅 Detected: %s\n\n", dateStr)
 	}
 
 	for i, group := range groups {
@@ -166,7 +145,7 @@ func (c *Client) formatMessage(groups []models.Event) string {
 			titleLink = escapeMarkdownV2(group.Title)
 		}
 
-		message += fmt.Sprintf("%d\\. %s\n", i+1, titleLink)
+		fmt.Fprintf(&b, "%d\\. %s\n", i+1, titleLink)
 
 		for _, change := range group.Markets {
 			directionEmoji := "📈"
@@ -174,44 +153,47 @@ func (c *Client) formatMessage(groups []models.Event) string {
 				directionEmoji = "📉"
 			}
 
-			magnitudePct := change.Magnitude * 100
-			oldPct := change.OldProbability * 100
-			newPct := change.NewProbability * 100
-
-			magnitudeStr := escapeMarkdownV2(fmt.Sprintf("%.1f%%", magnitudePct))
-			oldPctStr := escapeMarkdownV2(fmt.Sprintf("%.1f%%", oldPct))
-			newPctStr := escapeMarkdownV2(fmt.Sprintf("%.1f%%", newPct))
+			magnitudeStr := formatPercentMD(change.Magnitude * 100)
+			oldPctStr := formatPercentMD(change.OldProbability * 100)
+			newPctStr := formatPercentMD(change.NewProbability * 100)
 			windowStr := escapeMarkdownV2(formatDuration(change.TimeWindow))
 
 			// Show market question as sub-bullet when it differs from the event question
 			if change.MarketQuestion != "" && change.MarketQuestion != group.Title {
 				escapedMarketQ := escapeMarkdownV2(change.MarketQuestion)
-				message += fmt.Sprintf("   🎯 %s\n", escapedMarketQ)
+				fmt.Fprintf(&b, "   🎯 %s\n", escapedMarketQ)
 			}
 
-			message += fmt.Sprintf("   %s *%s* \\(%s → %s\\) ⏱ %s\n",
+			fmt.Fprintf(&b, "   %s *%s* \\(%s → %s\\) ⏱ %s\n",
 				directionEmoji, magnitudeStr, oldPctStr, newPctStr, windowStr)
 		}
 
-		message += "\n"
+		b.WriteString("\n")
 	}
 
-	return message
+	return b.String()
 }
 
+// markdownV2Escaper is built once at init; Replace then runs off a precomputed
+// single-byte lookup table instead of a per-rune switch on every call.
+var markdownV2Escaper = strings.NewReplacer(
+	`_`, `\_`, `*`, `\*`, `[`, `\[`, `]`, `\]`, `(`, `\(`, `)`, `\)`,
+	`~`, `\~`, "`", "\\`", `>`, `\>`, `#`, `\#`, `+`, `\+`, `-`, `\-`,
+	`=`, `\=`, `|`, `\|`, `{`, `\{`, `}`, `\}`, `.`, `\.`, `!`, `\!`,
+)
+
 // escapeMarkdownV2 escapes special characters for Telegram MarkdownV2.
 // Characters that need escaping: _ * [ ] ( ) ~ ` > # + - = | { } . !
 func escapeMarkdownV2(text string) string {
-	var b strings.Builder
-	b.Grow(len(text) + len(text)/4) // pre-allocate with room for escapes
-	for _, char := range text {
-		switch char {
-		case '_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!':
-			b.WriteByte('\\')
-		}
-		b.WriteRune(char)
-	}
-	return b.String()
+	return markdownV2Escaper.Replace(text)
+}
+
+// formatPercentMD renders a percentage with one decimal as pre-escaped
+// MarkdownV2 (e.g. 12.5 → `12\.5%`). The decimal point is the only character
+// in this fixed shape that needs escaping, so formatting directly replaces the
+// Sprintf-then-escape round trip done per market line.
+func formatPercentMD(pct float64) string {
+	return strings.Replace(strconv.FormatFloat(pct, 'f', 1, 64), ".", `\.`, 1) + "%"
 }
 
 // formatDuration formats a duration in a human-readable way
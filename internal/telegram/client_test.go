@@ -24,6 +24,26 @@ func TestFormatDuration(t *testing.T) {
 	}
 }
 
+func TestFormatPercentMD(t *testing.T) {
+	tests := []struct {
+		pct      float64
+		expected string
+	}{
+		{12.5, `12\.5%`},
+		{0.0, `0\.0%`},
+		{100.0, `100\.0%`},
+		{7.25, `7\.2%`}, // rounds like %.1f
+		{7.35, `7\.3%`},
+	}
+
+	for _, tt := range tests {
+		result := formatPercentMD(tt.pct)
+		if result != tt.expected {
+			t.Errorf("formatPercentMD(%v) = %s, expected %s", tt.pct, result, tt.expected)
+		}
+	}
+}
+
 func TestEscapeMarkdownV2(t *testing.T) {
 	tests := []struct {
 		input    string